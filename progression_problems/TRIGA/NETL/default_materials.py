@@ -13,9 +13,8 @@ class DefaultMaterials:
 
     DEFAULT_TEMPERATURE = 293.6
 
-    @classmethod
-    def fresh_fuel(cls,
-                   temperature:   float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def fresh_fuel(temperature:   float = DEFAULT_TEMPERATURE,
                    density:       float = 5.85,
                    density_units: str = 'g/cm3') -> openmc.Material:
         """ Creates and returns the default fresh fuel material for TRIGA reactors.
@@ -62,9 +61,8 @@ class DefaultMaterials:
         material.add_s_alpha_beta('c_Zr_in_ZrH')
         return material
 
-    @classmethod
-    def water(cls,
-              temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def water(temperature: float = DEFAULT_TEMPERATURE,
               density: float = 1.0,
               density_units: str = 'g/cm3') -> openmc.Material:
         """Creates and returns water material.
@@ -99,9 +97,8 @@ class DefaultMaterials:
         material.add_s_alpha_beta('c_H_in_H2O')
         return material
 
-    @classmethod
-    def zirc_filler(cls,
-                    temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def zirc_filler(temperature: float = DEFAULT_TEMPERATURE,
                     density: float = 0.0408,
                     density_units: str = 'atom/b-cm') -> openmc.Material:
         """Creates and returns zirconium filler rod material.
@@ -138,9 +135,8 @@ class DefaultMaterials:
         material.add_nuclide('Zr96', 0.0280, percent_type='ao')
         return material
 
-    @classmethod
-    def stainless_steel(cls,
-                        temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def stainless_steel(temperature: float = DEFAULT_TEMPERATURE,
                         density: float = 0.0858,
                         density_units: str = 'atom/b-cm') -> openmc.Material:
         """Creates and returns stainless steel material.
@@ -186,9 +182,8 @@ class DefaultMaterials:
         material.add_nuclide('Ni64', 6.85e-05,   percent_type='ao')
         return material
 
-    @classmethod
-    def graphite(cls,
-                 temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def graphite(temperature: float = DEFAULT_TEMPERATURE,
                  density: float = 1.6,
                  density_units: str = 'g/cm3') -> openmc.Material:
         """Creates and returns graphite material.
@@ -222,9 +217,8 @@ class DefaultMaterials:
         material.add_s_alpha_beta('c_Graphite')
         return material
 
-    @classmethod
-    def aluminum(cls,
-                 temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def aluminum(temperature: float = DEFAULT_TEMPERATURE,
                  density: float = 2.7,
                  density_units: str = 'g/cm3') -> openmc.Material:
         """Creates and returns aluminum 6061-T6 material.
@@ -270,9 +264,8 @@ class DefaultMaterials:
         material.add_nuclide('Cu65', 2.1628e-05, percent_type='ao')
         return material
 
-    @classmethod
-    def air(cls,
-            temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def air(temperature: float = DEFAULT_TEMPERATURE,
             density: float = 0.001225,
             density_units: str = 'g/cm3') -> openmc.Material:
         """Creates and returns air material.
@@ -306,9 +299,8 @@ class DefaultMaterials:
         material.add_nuclide('O16', 0.21, percent_type='ao')
         return material
 
-    @classmethod
-    def control_rod_absorber(cls,
-                             temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def control_rod_absorber(temperature: float = DEFAULT_TEMPERATURE,
                              density: float = 2.48,
                              density_units: str = 'g/cm3') -> openmc.Material:
         """Creates and returns fuel follower control rod absorber material.
@@ -343,9 +335,8 @@ class DefaultMaterials:
         material.add_element('C',   0.2,    percent_type='ao')
         return material
 
-    @classmethod
-    def molybdenum(cls,
-                   temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def molybdenum(temperature: float = DEFAULT_TEMPERATURE,
                    density: float = 10.3,
                    density_units: str = 'g/cm3') -> openmc.Material:
         """Creates and returns molybdenum material.
@@ -385,9 +376,8 @@ class DefaultMaterials:
         return material
 
 
-    @classmethod
-    def cadmium(cls,
-                temperature: float = DEFAULT_TEMPERATURE,
+    @staticmethod
+    def cadmium(temperature: float = DEFAULT_TEMPERATURE,
                 density: float = 8.65,
                 density_units: str = 'g/cm3') -> openmc.Material:
         """Creates and returns cadmium material.
@@ -2,18 +2,85 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from functools import partial
 from math import cos, radians
-from typing import ClassVar, Literal, Optional, Dict, Tuple, List, TypeAlias
+from typing import Callable, ClassVar, Literal, Optional, Dict, Tuple, List, TypeAlias
 
+import numpy as np
 import openmc
 
 from progression_problems.constants import CM_PER_INCH
 from progression_problems.TRIGA.NETL.default_materials import DefaultMaterials
 
+# Default fuel element dimensions, also used for the graphite element defaults
+_FUEL_MEAT_OUTER_RADIUS             = 1.435 * 0.5 * CM_PER_INCH
+_CLADDING_THICKNESS                 = 0.020 * CM_PER_INCH
+_CLADDING_OUTER_RADIUS              = 1.475 * 0.5 * CM_PER_INCH
+_UPPER_END_FITTING_LENGTH           = 7.3552
+_LOWER_END_FITTING_LENGTH           = 7.6209
+_UPPER_AIR_GAP_THICKNESS            = 0.5   * CM_PER_INCH
+_UPPER_GRAPHITE_REFLECTOR_THICKNESS = 2.56  * CM_PER_INCH
+_FUEL_MEAT_LENGTH                   = 15.0  * CM_PER_INCH
+_MOLY_DISC_THICKNESS                = 0.031 * CM_PER_INCH
+_LOWER_GRAPHITE_REFLECTOR_THICKNESS = 3.72  * CM_PER_INCH
+
+
+def _fuel_element_interior_length(lower_graphite_reflector_thickness: float,
+                                  moly_disc_thickness:                float,
+                                  fuel_meat_length:                   float,
+                                  upper_graphite_reflector_thickness: float,
+                                  upper_air_gap_thickness:            float) -> float:
+    """ Returns the fuel element interior length [cm]
+
+    This is the length from the bottom of the lower graphite reflector to the top of the upper air gap.
+    """
+    return lower_graphite_reflector_thickness + \
+           moly_disc_thickness                + \
+           fuel_meat_length                   + \
+           upper_graphite_reflector_thickness + \
+           upper_air_gap_thickness
+
+
+_FUEL_ELEMENT_INTERIOR_LENGTH = _fuel_element_interior_length(_LOWER_GRAPHITE_REFLECTOR_THICKNESS,
+                                                              _MOLY_DISC_THICKNESS,
+                                                              _FUEL_MEAT_LENGTH,
+                                                              _UPPER_GRAPHITE_REFLECTOR_THICKNESS,
+                                                              _UPPER_AIR_GAP_THICKNESS)
+
+
+_SHARED_DEFAULT_MATERIALS: Dict[Callable[[], openmc.Material], openmc.Material] = {}
+
+def _shared_default(builder: Callable[[], openmc.Material]) -> Callable[[], openmc.Material]:
+    """ Returns a default factory which shares one material built by builder between components
+
+    Only non-burnable default materials should be shared.  Shared materials keep their IDs
+    until clear_shared_default_materials is called.
+    """
+    def factory() -> openmc.Material:
+        material = _SHARED_DEFAULT_MATERIALS.get(builder)
+        if material is None:
+            material = _SHARED_DEFAULT_MATERIALS[builder] = builder()
+        return material
+    return factory
 
-@dataclass
+
+def clear_shared_default_materials() -> None:
+    """ Discards the shared default materials so that they are rebuilt on next use
+
+    Call this alongside openmc.reset_auto_ids, otherwise the shared materials keep their
+    old IDs, which may collide with the IDs of materials created after the reset.
+    """
+    _SHARED_DEFAULT_MATERIALS.clear()
+
+
+@dataclass(slots=True)
 class TRIGA:
     """Dataclass for TRIGA specifications
 
+    Default non-burnable materials are shared between the components that use them,
+    while default fuel and absorber materials are built per component.  Use
+    openmc.Material.clone to obtain an independent copy before modifying a shared
+    default material, and call clear_shared_default_materials alongside
+    openmc.reset_auto_ids.
+
     References
     ----------
     .. [1] "University of Texas at Austin Nuclear Engineering Teaching Laboratory
@@ -67,7 +134,7 @@ class TRIGA:
         Default: TRIGA.Core()
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class FuelElement:
         """Dataclass for TRIGA fuel elements.
 
@@ -109,7 +176,7 @@ class TRIGA:
             lower graphite reflector to the top of the upper air gap.
         """
 
-        @dataclass
+        @dataclass(slots=True)
         class ZrFillRod:
             """Dataclass for Zr Fill Rod.
 
@@ -124,12 +191,12 @@ class TRIGA:
                 Default: DefaultMaterials.zirc_filler() (Ref. [2]_ pg. 51)
             """
             radius: float = 0.25 * 0.5 * CM_PER_INCH
-            material: openmc.Material = field(default_factory=DefaultMaterials.zirc_filler)
+            material: openmc.Material = field(default_factory=_shared_default(DefaultMaterials.zirc_filler))
 
             def __post_init__(self):
                 assert self.radius > 0, "Zr Fill Rod radius must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class FuelMeat:
             """Dataclass for Fuel Meat.
 
@@ -149,8 +216,8 @@ class TRIGA:
                 Default: DefaultMaterials.fresh_fuel() (Ref. [2]_ pg. 51)
             """
             inner_radius: float = 0.25  * 0.5 * CM_PER_INCH
-            outer_radius: float = 1.435 * 0.5 * CM_PER_INCH
-            length:       float = 15.0 * CM_PER_INCH
+            outer_radius: float = _FUEL_MEAT_OUTER_RADIUS
+            length:       float = _FUEL_MEAT_LENGTH
             material:     openmc.Material = field(default_factory=DefaultMaterials.fresh_fuel)
 
             def __post_init__(self):
@@ -158,7 +225,7 @@ class TRIGA:
                 assert self.outer_radius > self.inner_radius, "Fuel Meat outer radius must be larger than inner radius."
                 assert self.length > 0, "Fuel Meat length must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class Cladding:
             """Dataclass for Cladding.
 
@@ -174,15 +241,15 @@ class TRIGA:
                 Material of the Cladding.
                 Default: DefaultMaterials.stainless_steel() (Ref. [2]_ pg. 51)
             """
-            thickness:    float = 0.020 * CM_PER_INCH
-            outer_radius: float = 1.475 * 0.5 * CM_PER_INCH
-            material:     openmc.Material = field(default_factory=DefaultMaterials.stainless_steel)
+            thickness:    float = _CLADDING_THICKNESS
+            outer_radius: float = _CLADDING_OUTER_RADIUS
+            material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.stainless_steel))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Cladding thickness must be positive."
                 assert self.outer_radius > 0, "Cladding outer radius must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class GraphiteReflector:
             """Dataclass for Graphite Reflector.
 
@@ -200,13 +267,13 @@ class TRIGA:
             """
             radius:    float = 1.430 * 0.5 * CM_PER_INCH
             thickness: float = 3.420 * CM_PER_INCH
-            material:  openmc.Material = field(default_factory=DefaultMaterials.graphite)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.graphite))
 
             def __post_init__(self):
                 assert self.radius > 0, "Graphite Reflector radius must be positive."
                 assert self.thickness > 0, "Graphite Reflector thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class MolyDisc:
             """Dataclass for Molybdenum Discs.
 
@@ -223,14 +290,14 @@ class TRIGA:
                 Default: DefaultMaterials.molybdenum() (Ref. [2]_ pg. 51)
             """
             radius:    float = 1.431 * 0.5 * CM_PER_INCH
-            thickness: float = 0.031 * CM_PER_INCH
-            material:  openmc.Material = field(default_factory=DefaultMaterials.molybdenum)
+            thickness: float = _MOLY_DISC_THICKNESS
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.molybdenum))
 
             def __post_init__(self):
                 assert self.radius > 0, "Moly Disc radius must be positive."
                 assert self.thickness > 0, "Moly Disc thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class AirGap:
             """Dataclass for Air Gaps.
 
@@ -243,13 +310,13 @@ class TRIGA:
                 Material of the air gap.
                 Default: DefaultMaterials.air() (Ref. [2]_ pg. 50)
             """
-            thickness: float = 0.5 * CM_PER_INCH
-            material:  openmc.Material = field(default_factory=DefaultMaterials.air)
+            thickness: float = _UPPER_AIR_GAP_THICKNESS
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.air))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Air Gap thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class EndFitting:
             """Dataclass for End Fittings.
 
@@ -268,7 +335,7 @@ class TRIGA:
             """
             length:    float
             direction: Literal['up', 'down']
-            material:  openmc.Material = field(default_factory=DefaultMaterials.stainless_steel)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.stainless_steel))
 
             def __post_init__(self):
                 assert self.length > 0, "End Fitting length must be positive."
@@ -276,27 +343,32 @@ class TRIGA:
 
         cladding:                 Cladding          = field(default_factory=Cladding)
         upper_end_fitting:        EndFitting        = field(default_factory=
-                                                            partial(EndFitting, length=7.3552, direction='up'))
+                                                            partial(EndFitting,
+                                                                    length=_UPPER_END_FITTING_LENGTH, direction='up'))
         upper_air_gap:            AirGap            = field(default_factory=AirGap)
         upper_graphite_reflector: GraphiteReflector = field(default_factory=
-                                                            partial(GraphiteReflector, thickness=2.56 * CM_PER_INCH))
+                                                            partial(GraphiteReflector,
+                                                                    thickness=_UPPER_GRAPHITE_REFLECTOR_THICKNESS))
         zr_fill_rod:              ZrFillRod         = field(default_factory=ZrFillRod)
         fuel_meat:                FuelMeat          = field(default_factory=FuelMeat)
         moly_disc:                MolyDisc          = field(default_factory=MolyDisc)
         lower_graphite_reflector: GraphiteReflector = field(default_factory=
-                                                            partial(GraphiteReflector, thickness=3.72 * CM_PER_INCH))
+                                                            partial(GraphiteReflector,
+                                                                    thickness=_LOWER_GRAPHITE_REFLECTOR_THICKNESS))
         lower_end_fitting:        EndFitting        = field(default_factory=
-                                                            partial(EndFitting, length=7.6209, direction='down'))
+                                                            partial(EndFitting,
+                                                                    length=_LOWER_END_FITTING_LENGTH, direction='down'))
+        interior_length:          float             = field(init=False)
 
         def __post_init__(self):
-            self.interior_length = self.lower_graphite_reflector.thickness + \
-                                   self.moly_disc.thickness                + \
-                                   self.fuel_meat.length                   + \
-                                   self.upper_graphite_reflector.thickness + \
-                                   self.upper_air_gap.thickness
+            self.interior_length = _fuel_element_interior_length(self.lower_graphite_reflector.thickness,
+                                                                 self.moly_disc.thickness,
+                                                                 self.fuel_meat.length,
+                                                                 self.upper_graphite_reflector.thickness,
+                                                                 self.upper_air_gap.thickness)
 
 
-    @dataclass
+    @dataclass(slots=True)
     class GraphiteElement:
         """Dataclass for TRIGA graphite elements.
 
@@ -307,18 +379,18 @@ class TRIGA:
             Default: Cladding()
         upper_end_fitting : GraphiteElement.EndFitting
             Upper End Fitting specifications.
-            Default: EndFitting(length=TRIGA.FuelElement().upper_end_fitting.length, direction='up')
+            Default: EndFitting(length=7.3552, direction='up')
             (Ref. [1]_ Section 4.2.3.b)
         graphite_meat : GraphiteElement.GraphiteMeat
             Graphite Meat specifications.
             Default: GraphiteMeat()
         lower_end_fitting : GraphiteElement.EndFitting
             Lower End Fitting specifications.
-            Default: EndFitting(length=TRIGA.FuelElement().lower_end_fitting.length, direction='down')
+            Default: EndFitting(length=7.6209, direction='down')
             (Ref. [1]_ Section 4.2.3.b)
         """
 
-        @dataclass
+        @dataclass(slots=True)
         class GraphiteMeat:
             """Dataclass for Graphite Meat.
 
@@ -334,15 +406,15 @@ class TRIGA:
                 Material of the graphite meat.
                 Default: DefaultMaterials.graphite() (Ref. [2]_ pg. 50)
             """
-            outer_radius: float = field(default_factory=lambda: TRIGA.FuelElement.FuelMeat().outer_radius)
-            length:       float = field(default_factory=lambda: TRIGA.FuelElement().interior_length)
-            material:     openmc.Material = field(default_factory=DefaultMaterials.graphite)
+            outer_radius: float = _FUEL_MEAT_OUTER_RADIUS
+            length:       float = _FUEL_ELEMENT_INTERIOR_LENGTH
+            material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.graphite))
 
             def __post_init__(self):
                 assert self.outer_radius > 0, "Graphite Meat outer radius must be positive."
                 assert self.length > 0, "Graphite Meat length must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class Cladding:
             """Dataclass for Cladding.
 
@@ -358,15 +430,15 @@ class TRIGA:
                 Material of the cladding.
                 Default: DefaultMaterials.aluminum() (Ref. [2]_ pg. 50)
             """
-            thickness:    float = field(default_factory=lambda: TRIGA.FuelElement.Cladding().thickness)
-            outer_radius: float = field(default_factory=lambda: TRIGA.FuelElement.Cladding().outer_radius)
-            material:     openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+            thickness:    float = _CLADDING_THICKNESS
+            outer_radius: float = _CLADDING_OUTER_RADIUS
+            material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Cladding thickness must be positive."
                 assert self.outer_radius > 0, "Cladding outer radius must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class EndFitting:
             """Dataclass for End Fittings.
 
@@ -385,23 +457,21 @@ class TRIGA:
             """
             length:    float
             direction: Literal['up', 'down']
-            material:  openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
             def __post_init__(self):
                 assert self.length > 0, "End Fitting length must be positive."
                 assert self.direction in ('up', 'down'), "End Fitting direction must be either 'up' or 'down'."
 
         cladding:           Cladding          = field(default_factory=Cladding)
-        upper_end_fitting:  EndFitting        = field(default_factory=lambda: TRIGA.GraphiteElement.EndFitting(
-                                                          length    = TRIGA.FuelElement().upper_end_fitting.length,
-                                                          direction = 'up'))
+        upper_end_fitting:  EndFitting        = field(default_factory=
+                                                      partial(EndFitting, length=_UPPER_END_FITTING_LENGTH, direction='up'))
         graphite_meat:      GraphiteMeat      = field(default_factory=GraphiteMeat)
-        lower_end_fitting:  EndFitting        = field(default_factory=lambda: TRIGA.GraphiteElement.EndFitting(
-                                                          length    = TRIGA.FuelElement().lower_end_fitting.length,
-                                                          direction = 'down'))
+        lower_end_fitting:  EndFitting        = field(default_factory=
+                                                      partial(EndFitting, length=_LOWER_END_FITTING_LENGTH, direction='down'))
 
 
-    @dataclass
+    @dataclass(slots=True)
     class TransientRod:
         """Dataclass for the TRIGA transient rod.
 
@@ -440,7 +510,7 @@ class TRIGA:
             Default: 0.0 (assumed).
         """
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class Cladding:
             """Dataclass for the cladding.
 
@@ -459,13 +529,13 @@ class TRIGA:
 
             outer_radius: float = 1.25 * 0.5 * CM_PER_INCH
             thickness:    float = 0.028 * CM_PER_INCH
-            material:     openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+            material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
             def __post_init__(self):
                 assert self.outer_radius > 0, "Transient Rod Cladding outer radius must be positive."
                 assert self.thickness > 0, "Transient Rod Cladding thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class ElementPlug:
             """Dataclass for the element plugs.
 
@@ -480,12 +550,12 @@ class TRIGA:
             """
 
             thickness: float = 0.5 * CM_PER_INCH
-            material:  openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Element Plug thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class MagneformFitting:
             """
             Dataclass for the Magneform fittings.
@@ -501,12 +571,12 @@ class TRIGA:
             """
 
             thickness: float = 1.0 * CM_PER_INCH
-            material:  openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Magneform Fitting thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class Absorber:
             """Dataclass for the absorber.
 
@@ -531,7 +601,7 @@ class TRIGA:
                 assert self.radius > 0, "Absorber radius must be positive."
                 assert self.length > 0, "Absorber length must be positive."
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class AirGap:
             """Dataclass for the air gaps.
 
@@ -546,7 +616,7 @@ class TRIGA:
             """
 
             thickness: float = 19.75 * CM_PER_INCH
-            material:  openmc.Material = field(default_factory=DefaultMaterials.air)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.air))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Air Gap thickness must be positive."
@@ -567,7 +637,7 @@ class TRIGA:
             assert self.fraction_withdrawn <= 1.0, "Fraction withdrawn cannot exceed 1.0."
             assert self.maximum_withdrawal_distance > 0.0, "Maximum withdrawal distance must be positive."
 
-    @dataclass
+    @dataclass(slots=True)
     class FuelFollowerControlRod:
         """Dataclass for TRIGA fuel follower control rods.
 
@@ -624,7 +694,7 @@ class TRIGA:
             Default: 0.0 (assumed).
         """
 
-        @dataclass
+        @dataclass(slots=True)
         class Cladding:
             """Dataclass for the cladding.
 
@@ -643,14 +713,14 @@ class TRIGA:
 
             outer_radius: float = 1.31 * 0.5 * CM_PER_INCH
             thickness:    float = 0.02 * CM_PER_INCH
-            material:     openmc.Material = field(default_factory=DefaultMaterials.stainless_steel)
+            material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.stainless_steel))
 
 
             def __post_init__(self):
                 assert self.outer_radius > 0, "Fuel Follower Control Rod Cladding outer radius must be positive."
                 assert self.thickness > 0, "Fuel Follower Control Rod Cladding thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class ElementPlug:
             """Dataclass for the element plugs.
 
@@ -664,12 +734,12 @@ class TRIGA:
             """
 
             thickness: float
-            material:  openmc.Material = field(default_factory=DefaultMaterials.stainless_steel)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.stainless_steel))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Element Plug thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class MagneformFitting:
             """Dataclass for the Magneform fittings.
 
@@ -683,12 +753,12 @@ class TRIGA:
             """
 
             thickness: float
-            material:  openmc.Material = field(default_factory=DefaultMaterials.stainless_steel)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.stainless_steel))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Magneform Fitting thickness must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class Absorber:
             """Dataclass for the absorber.
 
@@ -713,7 +783,7 @@ class TRIGA:
                 assert self.radius > 0, "Absorber radius must be positive."
                 assert self.length > 0, "Absorber length must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class FuelFollower:
             """Dataclass for the fuel follower specification.
 
@@ -743,7 +813,7 @@ class TRIGA:
                 assert self.inner_radius > 0, "Fuel Follower inner radius must be positive."
                 assert self.length > 0, "Fuel Follower length must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class ZrFillRod:
             """Dataclass for the Zr Fill Rod.
 
@@ -758,12 +828,12 @@ class TRIGA:
                 Default: DefaultMaterials.zirc_filler() (Ref. [2]_ pg. 52)
             """
             radius:   float = 0.25 * 0.5 * CM_PER_INCH
-            material: openmc.Material = field(default_factory=DefaultMaterials.zirc_filler)
+            material: openmc.Material = field(default_factory=_shared_default(DefaultMaterials.zirc_filler))
 
             def __post_init__(self):
                 assert self.radius > 0, "Zr Fill Rod radius must be positive."
 
-        @dataclass
+        @dataclass(slots=True)
         class AirGap:
             """Dataclass for the air gaps.
 
@@ -777,7 +847,7 @@ class TRIGA:
             """
 
             thickness: float
-            material:  openmc.Material = field(default_factory=DefaultMaterials.air)
+            material:  openmc.Material = field(default_factory=_shared_default(DefaultMaterials.air))
 
             def __post_init__(self):
                 assert self.thickness > 0, "Air Gap thickness must be positive."
@@ -810,7 +880,7 @@ class TRIGA:
             assert self.maximum_withdrawal_distance > 0.0, "Maximum withdrawal distance must be positive."
 
 
-    @dataclass
+    @dataclass(slots=True)
     class SourceHolder:
         """Dataclass for the TRIGA source holder.
 
@@ -830,7 +900,7 @@ class TRIGA:
             Default: 1.1934 cm (Ref. [2]_ pg. 55)
         """
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class Cavity:
             """Dataclass for the source holder cavity.
 
@@ -855,13 +925,13 @@ class TRIGA:
             radius:                 float = 0.981 * 0.5 * CM_PER_INCH
             length:                 float = 3.0 * CM_PER_INCH
             core_centerline_offset: float = 0.0 * CM_PER_INCH
-            material:               openmc.Material = field(default_factory=DefaultMaterials.air)
+            material:               openmc.Material = field(default_factory=_shared_default(DefaultMaterials.air))
 
             def __post_init__(self):
                 assert self.radius > 0, "Source Holder Cavity radius must be positive."
                 assert self.length > 0, "Source Holder Cavity length must be positive."
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class Cladding:
             """Dataclass for the source holder cladding.
 
@@ -876,7 +946,7 @@ class TRIGA:
             """
 
             outer_radius: float = 1.435 * 0.5 * CM_PER_INCH
-            material:     openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+            material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
             def __post_init__(self):
                 assert self.outer_radius > 0, "Source Holder Cladding outer radius must be positive."
@@ -890,7 +960,7 @@ class TRIGA:
             assert self.distance_from_lower_grid_plate >= 0, "Distance from lower grid plate must be non-negative."
 
 
-    @dataclass
+    @dataclass(slots=True)
     class CentralThimble:
         """Dataclass for the TRIGA central thimble.
 
@@ -909,13 +979,13 @@ class TRIGA:
 
         inner_radius: float = 1.33 * 0.5 * CM_PER_INCH
         outer_radius: float = 1.5  * 0.5 * CM_PER_INCH
-        material: openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+        material: openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
         def __post_init__(self):
             assert self.inner_radius > 0, "Central Thimble inner radius must be positive."
             assert self.outer_radius > self.inner_radius, "Central Thimble outer radius must be larger than inner radius."
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class GridPlate:
         """Class for TRIGA grid plates.
 
@@ -938,7 +1008,7 @@ class TRIGA:
         fuel_penetration_radius: float
         control_rod_penetration_radius: float
         distance_from_core_centerline: float
-        material: openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+        material: openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
         def __post_init__(self):
             assert self.thickness > 0, "Grid Plate thickness must be positive."
@@ -946,7 +1016,7 @@ class TRIGA:
             assert self.control_rod_penetration_radius > 0, "Grid Plate control rod penetration radius must be positive."
 
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class RSRCavity:
         """Dataclass for TRIGA Rotary Specimen Rack Cavity.
 
@@ -973,10 +1043,15 @@ class TRIGA:
         material : openmc.Material
             Cavity fill material of the rotary specimen rack.
             Default: DefaultMaterials.air() (Ref. [2]_ pg. 48)
+        tube_positions : np.ndarray
+            Read-only view of the (number_of_tubes, 2) array of specimen tube center (x, y) coordinates
+            relative to the center of the rotary specimen rack [cm].  Tube k is located at an
+            angle of 2*pi*k/number_of_tubes counterclockwise from the +x axis.  Computed
+            once at construction.
         """
 
 
-        @dataclass
+        @dataclass(slots=True, frozen=True)
         class SpecimenTube:
             """Dataclass for specimen tubes.
 
@@ -995,7 +1070,7 @@ class TRIGA:
 
             outer_radius: float = 1.0 * 0.5 * CM_PER_INCH
             thickness:    float = 0.058 * CM_PER_INCH
-            material: openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+            material: openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
             def __post_init__(self):
                 assert self.outer_radius > 0, "Specimen Tube outer radius must be positive."
@@ -1006,7 +1081,8 @@ class TRIGA:
         number_of_tubes:         int          = 40
         tube_to_center_distance: float        = 26.312 * 0.5 * CM_PER_INCH
         tube_specs:              SpecimenTube = field(default_factory=SpecimenTube)
-        material:                openmc.Material = field(default_factory=DefaultMaterials.air)
+        material:                openmc.Material = field(default_factory=_shared_default(DefaultMaterials.air))
+        _tube_xy:                np.ndarray   = field(init=False, repr=False, compare=False)
 
         def __post_init__(self):
             assert self.outer_radius > 0, "Rotary Specimen Rack outer radius must be positive."
@@ -1014,8 +1090,18 @@ class TRIGA:
             assert self.number_of_tubes > 0, "Rotary Specimen Rack number of tubes must be positive."
             assert self.tube_to_center_distance > 0, "Rotary Specimen Rack tube to center distance must be positive."
 
+            angles = np.linspace(0.0, 2.0 * np.pi, self.number_of_tubes, endpoint=False)
+            tube_xy = self.tube_to_center_distance * np.column_stack((np.cos(angles), np.sin(angles)))
+            object.__setattr__(self, "_tube_xy", tube_xy)
 
-    @dataclass
+        @property
+        def tube_positions(self) -> np.ndarray:
+            tube_positions = self._tube_xy.view()
+            tube_positions.flags.writeable = False
+            return tube_positions
+
+
+    @dataclass(slots=True)
     class BeamPort:
         """Dataclass for TRIGA beam ports.
 
@@ -1051,15 +1137,15 @@ class TRIGA:
                                                                               [90.0, 90.0, 0.0]])
         translation:       Tuple[float, float, float] = (0.0, 0.0, 0.0)
         termination_plane: Optional[openmc.Plane] = None
-        tube_material:     openmc.Material = field(default_factory=DefaultMaterials.aluminum)
-        fill_material:     openmc.Material = field(default_factory=DefaultMaterials.air)
+        tube_material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
+        fill_material:     openmc.Material = field(default_factory=_shared_default(DefaultMaterials.air))
 
         def __post_init__(self):
             assert self.inner_radius > 0, "Beam Port inner radius must be positive."
             assert self.outer_radius > self.inner_radius, "Beam Port outer radius must be larger than inner radius."
 
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class Shroud:
         """Dataclass for the TRIGA shroud.
 
@@ -1086,7 +1172,7 @@ class TRIGA:
         height:             float = 23.13 * CM_PER_INCH
         large_hex_inradius: float = 10.75 * CM_PER_INCH
         small_hex_inradius: float = 10.21875 * CM_PER_INCH
-        material:           openmc.Material = field(default_factory=DefaultMaterials.aluminum)
+        material:           openmc.Material = field(default_factory=_shared_default(DefaultMaterials.aluminum))
 
         def __post_init__(self):
             assert self.thickness > 0, "Shroud thickness must be positive."
@@ -1097,7 +1183,7 @@ class TRIGA:
                 "Shroud large hex inradius must be larger than small hex inradius."
 
 
-    @dataclass
+    @dataclass(slots=True, frozen=True)
     class ReflectorCanister:
         """Dataclass for the TRIGA reflector canister.
 
@@ -1122,14 +1208,14 @@ class TRIGA:
         radius:                 float = 42.0 * 0.5 * CM_PER_INCH
         height:                 float = 23.13 * CM_PER_INCH
         core_centerline_offset: float = 0.565 * CM_PER_INCH
-        material:               openmc.Material = field(default_factory=DefaultMaterials.graphite)
+        material:               openmc.Material = field(default_factory=_shared_default(DefaultMaterials.graphite))
 
         def __post_init__(self):
             assert self.radius > 0, "Reflector radius must be positive."
             assert self.height > 0, "Reflector height must be positive."
 
 
-    @dataclass
+    @dataclass(slots=True)
     class Pool:
         """Dataclass for the TRIGA pool.
 
@@ -1147,7 +1233,7 @@ class TRIGA:
         """
         radius: float = 90.0
         height: float = 160.0
-        material: openmc.Material = field(default_factory=DefaultMaterials.water)
+        material: openmc.Material = field(default_factory=_shared_default(DefaultMaterials.water))
 
         def __post_init__(self):
             assert self.radius > 0, "Pool radius must be positive."
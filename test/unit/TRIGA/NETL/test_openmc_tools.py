@@ -1,6 +1,61 @@
+import copy
+
+import numpy as np
+import openmc
 import pytest
-from progression_problems.TRIGA.NETL.geometry_specs import TRIGA
+from progression_problems.TRIGA.NETL.geometry_specs import TRIGA, clear_shared_default_materials
+from progression_problems.TRIGA.NETL.default_materials import DefaultMaterials
 
 def test_progression_problem_1():
     triga = TRIGA()
-    assert triga is not None
\ No newline at end of file
+    assert triga is not None
+
+def test_default_materials_are_independent():
+    material             = DefaultMaterials.fresh_fuel()
+    material.temperature = 900.0
+    assert DefaultMaterials.fresh_fuel() is not material
+    assert DefaultMaterials.fresh_fuel().temperature          == DefaultMaterials.DEFAULT_TEMPERATURE
+    assert TRIGA.FuelElement().fuel_meat.material.temperature == DefaultMaterials.DEFAULT_TEMPERATURE
+
+def test_default_non_burnable_materials_are_shared():
+    first_element  = TRIGA.FuelElement()
+    second_element = TRIGA.FuelElement()
+    assert first_element.cladding.material  is     second_element.cladding.material
+    assert first_element.fuel_meat.material is not second_element.fuel_meat.material
+    assert TRIGA.TransientRod().absorber.material is not TRIGA.TransientRod().absorber.material
+
+    openmc.reset_auto_ids()
+    clear_shared_default_materials()
+    assert TRIGA.FuelElement().cladding.material is not first_element.cladding.material
+
+def test_shared_default_materials_do_not_collide_after_reset():
+    TRIGA.GraphiteElement()
+    openmc.reset_auto_ids()
+    clear_shared_default_materials()
+    fuel_element     = TRIGA.FuelElement()
+    graphite_element = TRIGA.GraphiteElement()
+    assert graphite_element.cladding.material.id != fuel_element.cladding.material.id
+
+def test_graphite_element_defaults_match_fuel_element():
+    fuel_element     = TRIGA.FuelElement()
+    graphite_element = TRIGA.GraphiteElement()
+    assert graphite_element.upper_end_fitting.length   == fuel_element.upper_end_fitting.length
+    assert graphite_element.lower_end_fitting.length   == fuel_element.lower_end_fitting.length
+    assert graphite_element.graphite_meat.length       == fuel_element.interior_length
+    assert graphite_element.graphite_meat.outer_radius == fuel_element.fuel_meat.outer_radius
+    assert graphite_element.cladding.thickness         == fuel_element.cladding.thickness
+    assert graphite_element.cladding.outer_radius      == fuel_element.cladding.outer_radius
+
+def test_rsr_cavity_tube_positions():
+    rsr = TRIGA.RSRCavity()
+    assert rsr.tube_positions.shape == (rsr.number_of_tubes, 2)
+    assert rsr.tube_positions[0] == pytest.approx([rsr.tube_to_center_distance, 0.0])
+    assert np.hypot(rsr.tube_positions[:, 0], rsr.tube_positions[:, 1]) == pytest.approx(rsr.tube_to_center_distance)
+
+@pytest.mark.parametrize("make_rsr", [TRIGA.RSRCavity, lambda: copy.deepcopy(TRIGA.RSRCavity())],
+                         ids=["fresh", "deepcopy"])
+def test_rsr_cavity_tube_positions_are_read_only(make_rsr):
+    rsr = make_rsr()
+    assert not rsr.tube_positions.flags.writeable
+    with pytest.raises(ValueError):
+        rsr.tube_positions[0, 0] = 0.0